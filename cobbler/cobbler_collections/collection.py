@@ -19,6 +19,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -178,15 +179,27 @@ class Collection(Generic[ITEM]):
             except Exception:
                 return self.listing.get(name, None)
 
+        # Only items with this name can match, thus all other items can be skipped without converting them to a dict.
+        search_name = self.__literal_search_name(kargs)
+        # find_match() stops at the first key that doesn't match, thus try the most selective keys first. The result
+        # is the same for every order, but the order decides which key is compared first. A key that can't be compared
+        # ("find cannot compare type") thus may or may not raise its TypeError for items that another key rules out.
+        if len(kargs) > 1:
+            kargs = dict(sorted(kargs.items(), key=self.__predicate_cost))
+
         if self.api.settings().lazy_start:
             # Forced deserialization of the entire collection to prevent deadlock in the search loop
             for obj_name in self.get_names():
+                if search_name is not None and obj_name.lower() != search_name:
+                    continue
                 obj = self.get(obj_name)
                 if obj is not None and not obj.inmemory:
                     obj.deserialize()
 
         with self.lock:
             for obj in self:
+                if search_name is not None and obj.name.lower() != search_name:
+                    continue
                 if obj.find_match(kargs, no_errors=no_errors):
                     matches.append(obj)
 
@@ -196,6 +209,46 @@ class Collection(Generic[ITEM]):
             return matches[0]
         return matches
 
+    @staticmethod
+    def __literal_search_name(kargs: Dict[str, Any]) -> Optional[str]:
+        """
+        Names are compared case-insensitively by :meth:`~cobbler.items.item.Item.find_match`. A name without wildcards
+        and negation thus only matches the items that have the same name in lowercase.
+
+        :param kargs: The rekeyed search arguments.
+        :return: The lowercase name to search for or None if the search could match items with any name.
+        """
+        search_name = kargs.get("name")
+        if not isinstance(search_name, str) or search_name.startswith("~"):
+            return None
+        if item_base._is_wildcard_pattern(  # pyright: ignore [reportPrivateUsage]
+            search_name
+        ):
+            return None
+        return search_name.lower()
+
+    @staticmethod
+    def __predicate_cost(predicate: Tuple[str, Any]) -> Tuple[int, int]:
+        """
+        Estimate how expensive and how unselective a single search argument is. Names and UIDs identify a single item,
+        plain strings are compared with a single equality check and wildcards need a regular expression. Negated values
+        match almost every item and are thus checked last.
+
+        :param predicate: The key and the value of a search argument.
+        :return: The sort key, lower values are checked first.
+        """
+        key, value = predicate
+        if not isinstance(value, str):
+            return 1, 1
+        if value.startswith("~"):
+            return 2, 0
+        selectivity = 0 if key in ("name", "uid") else 1
+        if item_base._is_wildcard_pattern(  # pyright: ignore [reportPrivateUsage]
+            value
+        ):
+            return selectivity, 1
+        return selectivity, 0
+
     SEARCH_REKEY = {
         "kopts": "kernel_options",
         "kopts_post": "kernel_options_post",
@@ -4,9 +4,10 @@ except the Python standard library.
 """
 
 import enum
+import sys
 from typing import TypeVar, Union
 
-VALUE_INHERITED = "<<inherit>>"
+VALUE_INHERITED = sys.intern("<<inherit>>")
 VALUE_NONE = "none"
 CONVERTABLEENUM = TypeVar("CONVERTABLEENUM", bound="ConvertableEnum")
 
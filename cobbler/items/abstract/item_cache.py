@@ -16,6 +16,9 @@ class ItemCache:
     A Cobbler ItemCache object.
     """
 
+    # Every item owns a cache object, so keep them free of a per-instance __dict__.
+    __slots__ = ("_cached_dict", "api", "settings")
+
     def __init__(self, api: "CobblerAPI"):
         """
         Constructor
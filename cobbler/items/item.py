@@ -14,6 +14,10 @@ V3.4.0 (unreleased):
         * ``logical_parent`` was added.
         * ``get_parent()`` was added which returns the internal reference that is used to return the object of the
           ``parent`` property.
+    * Removed the unused ``last_cached_mtime`` attribute, the dict cache is handled by ``cache``.
+    * ``to_dict()``:
+        * Accepts new parameter ``for_serialization``
+        * Lists and dictionaries are copied shallowly, nested values are shared with the item
 V3.3.4 (unreleased):
     * No changes
 V3.3.3:
@@ -100,12 +104,28 @@ V2.8.5:
 import copy
 import enum
 import fnmatch
+import functools
 import logging
 import pprint
 import re
+import string
+import sys
 import uuid
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import yaml
 
@@ -126,6 +146,83 @@ if TYPE_CHECKING:
 
 
 RE_OBJECT_NAME = re.compile(r"[a-zA-Z0-9_\-.:]*$")
+# Deletes every character that is allowed by RE_OBJECT_NAME. Names that are not empty afterwards are invalid.
+_OBJECT_NAME_CHARS = str.maketrans(
+    "", "", string.ascii_letters + string.digits + "_-.:"
+)
+# Marker for getattr() lookups where None is a valid value.
+_MISSING = object()
+# Finds the characters that make a search string a wildcard pattern in a single scan.
+_WILDCARD_RE = re.compile(r"[?*\[]")
+# Search strings that match a boolean value of True.
+_TRUTHY_SEARCH_VALUES = frozenset(("true", "1", "y", "yes"))
+# Keys that find_match() also looks up in the interfaces of a system.
+_INTERFACE_SEARCH_KEYS = frozenset(
+    (
+        "cnames",
+        "connected_mode",
+        "if_gateway",
+        "ipv6_default_gateway",
+        "ipv6_mtu",
+        "ipv6_prefix",
+        "ipv6_secondaries",
+        "ipv6_static_routes",
+        "management",
+        "mtu",
+        "static",
+        "mac_address",
+        "ip_address",
+        "ipv6_address",
+        "netmask",
+        "virt_bridge",
+        "dhcp_tag",
+        "dns_name",
+        "static_routes",
+        "interface_type",
+        "interface_master",
+        "bonding_opts",
+        "bridge_opts",
+        "interface",
+    )
+)
+
+
+def _is_wildcard_pattern(value: str) -> bool:
+    """
+    Check whether a search string is a shell-style wildcard pattern.
+
+    :param value: The search string.
+    :return: True if the string contains any of "?", "*" or "[".
+    """
+    return _WILDCARD_RE.search(value) is not None
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_search(search: str) -> Tuple[str, Optional[Pattern[str]]]:
+    """
+    Prepare a search string for the comparison with the values of an item. Searches compare the same string against
+    every item of a collection, so the result is cached.
+
+    :param search: The search string.
+    :return: The lowercase search string and, if it contains shell-style wildcards, the compiled regular expression
+             that matches it.
+    """
+    search_lower = search.lower()
+    if not _is_wildcard_pattern(search_lower):
+        return search_lower, None
+    return search_lower, re.compile(fnmatch.translate(search_lower))
+
+
+@functools.lru_cache(maxsize=512)
+def _load_yaml(document: str) -> Any:
+    """
+    Parse a YAML document. Deserializing a collection often parses the same documents over and over, so the result is
+    cached. It is shared between all callers and must not be modified.
+
+    :param document: The YAML document.
+    :return: The parsed object.
+    """
+    return yaml.safe_load(document)
 
 
 class Item:
@@ -137,6 +234,9 @@ class Item:
     TYPE_NAME = "generic"
     COLLECTION_TYPE = "generic"
 
+    # Shared by all items instead of being bound to every instance.
+    logger = logging.getLogger()
+
     # Item types dependencies.
     # Used to determine descendants and cache invalidation.
     # Format: {"Item Type": [("Dependent Item Type", "Dependent Type attribute"), ..], [..]}
@@ -203,6 +303,22 @@ class Item:
         "system": ([("image", "image"), ("profile", "profile")], []),
     }
 
+    # Names of the attributes that store the raw value of a property, filled on first use by __attribute_name().
+    # Format: {"Property name": "Attribute name"}
+    _ATTRIBUTE_NAMES: Dict[str, str] = {}
+
+    # Names involved in resolving a property, filled on first use by __resolve_names().
+    # Format: {"Property name": ("Attribute name", "Property name on the parent", "Settings name")}
+    _RESOLVE_NAMES: Dict[str, Tuple[str, str, str]] = {}
+
+    # Keys of to_dict() per attribute name, filled on first use by __dict_key(). Attributes that are not part of
+    # to_dict() map to None.
+    # Format: {"Attribute name": "Key name"}
+    _DICT_KEYS: Dict[str, Optional[str]] = {}
+
+    # Keys of to_dict() that are computed from other values and thus not written by serialize().
+    _NOT_SERIALIZED_KEYS = frozenset(("remote_grub_kernel", "remote_grub_initrd"))
+
     @classmethod
     def __find_compare(
         cls,
@@ -221,18 +337,11 @@ class Item:
         if isinstance(from_obj, str):
             # FIXME: fnmatch is only used for string to string comparisons which should cover most major usage, if
             #        not, this deserves fixing
-            from_obj_lower = from_obj.lower()
-            from_search_lower = from_search.lower()  # type: ignore
+            from_search_lower, pattern = _compile_search(from_search)  # type: ignore
             # It's much faster to not use fnmatch if it's not needed
-            if (
-                "?" not in from_search_lower
-                and "*" not in from_search_lower
-                and "[" not in from_search_lower
-            ):
-                match = from_obj_lower == from_search_lower  # type: ignore
-            else:
-                match = fnmatch.fnmatch(from_obj_lower, from_search_lower)  # type: ignore
-            return match  # type: ignore
+            if pattern is None:
+                return from_obj.lower() == from_search_lower
+            return pattern.match(from_obj.lower()) is not None
 
         if isinstance(from_search, str):
             if isinstance(from_obj, list):
@@ -245,21 +354,66 @@ class Item:
                 from_search = input_converters.input_string_or_dict(
                     from_search, allow_multiples=True
                 )
-                for dict_key in list(from_search.keys()):  # type: ignore
-                    dict_value = from_search[dict_key]
-                    if dict_key not in from_obj:
-                        return False
-                    if not (dict_value == from_obj[dict_key]):
-                        return False
-                return True
+                # Subset check of the key-value pairs, values don't need to be hashable for this.
+                return from_search.items() <= from_obj.items()  # type: ignore
             if isinstance(from_obj, bool):  # type: ignore
-                inp = from_search.lower() in ["true", "1", "y", "yes"]
+                inp = from_search.lower() in _TRUTHY_SEARCH_VALUES
                 if inp == from_obj:
                     return True
                 return False
 
         raise TypeError(f"find cannot compare type: {type(from_obj)}")
 
+    @classmethod
+    def __attribute_name(cls, property_name: str) -> str:
+        """
+        Look up the name of the attribute that stores the raw value of a property. The name is interned so lookups in
+        the instance dictionary can match it by identity.
+
+        :param property_name: The name of the property.
+        :return: The attribute name.
+        """
+        attribute = cls._ATTRIBUTE_NAMES.get(property_name)
+        if attribute is None:
+            attribute = sys.intern("_" + property_name)
+            cls._ATTRIBUTE_NAMES[property_name] = attribute
+        return attribute
+
+    @classmethod
+    def __dict_key(cls, name: str) -> Optional[str]:
+        """
+        Look up the key that the value of an attribute has in the result of to_dict(). The key is interned because
+        every item creates its dictionary with the same keys.
+
+        :param name: The attribute name.
+        :return: The key name or None in case the attribute is not part of the item's to_dict.
+        """
+        key = cls._DICT_KEYS.get(name, _MISSING)
+        if key is _MISSING:
+            key = sys.intern(name[1:].lower()) if cls.__is_dict_key(name) else None
+            cls._DICT_KEYS[name] = key
+        return key  # type: ignore
+
+    @classmethod
+    def __resolve_names(cls, property_name: str) -> Tuple[str, str, str]:
+        """
+        Look up the names that are required to resolve a property. The mapping is computed once per property name.
+
+        :param property_name: The property name to resolve.
+        :return: The attribute name, the property name on the logical parent and the name in the settings.
+        """
+        names = cls._RESOLVE_NAMES.get(property_name)
+        if names is None:
+            parent_name = property_name
+            settings_name = property_name
+            if property_name.startswith("proxy_url_"):
+                parent_name = "proxy"
+            if property_name == "owners":
+                settings_name = "default_ownership"
+            names = (cls.__attribute_name(parent_name), parent_name, settings_name)
+            cls._RESOLVE_NAMES[property_name] = names
+        return names
+
     @staticmethod
     def __is_dict_key(name: str) -> bool:
         """
@@ -272,7 +426,6 @@ class Item:
             and "__" not in name
             and name
             not in {
-                "_last_cached_mtime",
                 "_cache",
                 "_supported_boot_loaders",
                 "_has_initialized",
@@ -328,15 +481,15 @@ class Item:
         self._fetchable_files: Union[Dict[Any, Any], str] = {}
         self._boot_files: Union[Dict[Any, Any], str] = {}
         self._template_files: Dict[str, Any] = {}
-        self._last_cached_mtime = 0
         self._owners: Union[List[Any], str] = enums.VALUE_INHERITED
+        # The cache holds the reference to the settings of the API. The settings object is never replaced, only
+        # updated, thus the resolve methods use this reference instead of calling "self.api.settings()" every time.
         self._cache: ItemCache = ItemCache(api)
         self._mgmt_classes: Union[List[Any], str] = enums.VALUE_INHERITED
         self._mgmt_parameters: Union[Dict[Any, Any], str] = {}
         self._is_subobject = is_subobject
         self._inmemory = True
 
-        self.logger = logging.getLogger()
         self.api = api
 
         if len(kwargs) > 0:
@@ -350,14 +503,12 @@ class Item:
 
     def __eq__(self, other: Any) -> bool:
         """
-        Comparison based on the uid for our items.
+        Comparison based on the uid for our items. Objects without a uid are never equal to an Item.
 
         :param other: The other Item to compare.
         :return: True if uid is equal, otherwise false.
         """
-        if isinstance(other, Item):
-            return self._uid == other.uid
-        return False
+        return self._uid == getattr(other, "_uid", _MISSING)
 
     def __hash__(self):
         """
@@ -391,34 +542,31 @@ class Item:
                                 ``property_name``.
         :return: The resolved value.
         """
-        settings_name = property_name
-        if property_name.startswith("proxy_url_"):
-            property_name = "proxy"
-        if property_name == "owners":
-            settings_name = "default_ownership"
-        attribute = "_" + property_name
+        attribute, property_name, settings_name = self.__resolve_names(property_name)
 
-        if not hasattr(self, attribute):
+        try:
+            # The raw values are plain instance attributes, thus skip the descriptor lookup of getattr().
+            attribute_value = self.__dict__[attribute]
+        except KeyError as error:
             raise AttributeError(
-                f'{type(self)} "{self.name}" does not have property "{property_name}"'
-            )
-
-        attribute_value = getattr(self, attribute)
-        settings = self.api.settings()
-
-        if attribute_value == enums.VALUE_INHERITED:
-            logical_parent = self.logical_parent
-            if logical_parent is not None and hasattr(logical_parent, property_name):
-                return getattr(logical_parent, property_name)
-            if hasattr(settings, settings_name):
-                return getattr(settings, settings_name)
-            if hasattr(settings, f"default_{settings_name}"):
-                return getattr(settings, f"default_{settings_name}")
-            AttributeError(
-                f'{type(self)} "{self.name}" inherits property "{property_name}", but neither its parent nor'
-                f"settings have it"
-            )
+                f'{type(self)} "{self._name}" does not have property "{property_name}"'
+            ) from error
+        if attribute_value != enums.VALUE_INHERITED:
+            return attribute_value
 
+        logical_parent = self.logical_parent
+        if logical_parent is not None:
+            value = getattr(logical_parent, property_name, _MISSING)
+            if value is not _MISSING:
+                return value
+        settings = self._cache.settings
+        value = getattr(settings, settings_name, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = getattr(settings, "default_" + settings_name, _MISSING)
+        if value is not _MISSING:
+            return value
+        # Neither the parent nor the settings know the property, thus the raw value is returned.
         return attribute_value
 
     def _resolve_enum(
@@ -428,32 +576,35 @@ class Item:
         See :meth:`~cobbler.items.item.Item._resolve`
         """
         settings_name = property_name
-        attribute = "_" + property_name
+        attribute = self.__attribute_name(property_name)
 
-        if not hasattr(self, attribute):
+        try:
+            attribute_value = self.__dict__[attribute]
+        except KeyError as error:
             raise AttributeError(
-                f'{type(self)} "{self.name}" does not have property "{property_name}"'
-            )
-
-        attribute_value = getattr(self, attribute)
-        settings = self.api.settings()
-
-        if (
-            isinstance(attribute_value, enums.ConvertableEnum)
-            and attribute_value.value == enums.VALUE_INHERITED
-        ):
-            logical_parent = self.logical_parent
-            if logical_parent is not None and hasattr(logical_parent, property_name):
-                return getattr(logical_parent, property_name)
-            if hasattr(settings, settings_name):
-                return enum_type.to_enum(getattr(settings, settings_name))
-            if hasattr(settings, f"default_{settings_name}"):
-                return enum_type.to_enum(getattr(settings, f"default_{settings_name}"))
-            AttributeError(
-                f'{type(self)} "{self.name}" inherits property "{property_name}", but neither its parent nor'
-                "settings have it"
-            )
+                f'{type(self)} "{self._name}" does not have property "{property_name}"'
+            ) from error
+        # The setters always store enum members, so the isinstance() check can be skipped in favour of reading the
+        # value directly.
+        try:
+            is_inherited = attribute_value.value == enums.VALUE_INHERITED
+        except AttributeError:
+            is_inherited = False
+        if not is_inherited:
+            return attribute_value
 
+        logical_parent = self.logical_parent
+        if logical_parent is not None:
+            value = getattr(logical_parent, property_name, _MISSING)
+            if value is not _MISSING:
+                return value
+        settings = self._cache.settings
+        value = getattr(settings, settings_name, _MISSING)
+        if value is not _MISSING:
+            return enum_type.to_enum(value)
+        value = getattr(settings, "default_" + settings_name, _MISSING)
+        if value is not _MISSING:
+            return enum_type.to_enum(value)
         return attribute_value
 
     def _resolve_dict(self, property_name: str) -> Dict[str, Any]:
@@ -465,28 +616,34 @@ class Item:
         :return: The merged dictionary.
         :raises AttributeError: In case the the the object had no attribute with the name :py:property_name: .
         """
-        attribute = "_" + property_name
+        attribute = self.__attribute_name(property_name)
 
-        if not hasattr(self, attribute):
+        try:
+            attribute_value = self.__dict__[attribute]
+        except KeyError as error:
             raise AttributeError(
-                f'{type(self)} "{self.name}" does not have property "{property_name}"'
-            )
-
-        attribute_value = getattr(self, attribute)
-        settings = self.api.settings()
-
-        merged_dict: Dict[str, Any] = {}
+                f'{type(self)} "{self._name}" does not have property "{property_name}"'
+            ) from error
 
         logical_parent = self.logical_parent
-        if logical_parent is not None and hasattr(logical_parent, property_name):
-            merged_dict.update(getattr(logical_parent, property_name))
-        elif hasattr(settings, property_name):
-            merged_dict.update(getattr(settings, property_name))
+        parent_value: Any = _MISSING
+        if logical_parent is not None:
+            parent_value = getattr(logical_parent, property_name, _MISSING)
+
+        if parent_value is not _MISSING:
+            # The parent returns an already resolved dict, so it doesn't contain entries marked for removal anymore.
+            merged_dict: Dict[str, Any] = dict(parent_value)
+            needs_annihilate = False
+        else:
+            merged_dict = dict(getattr(self._cache.settings, property_name, {}))
+            needs_annihilate = True
 
         if attribute_value != enums.VALUE_INHERITED:
             merged_dict.update(attribute_value)
+            needs_annihilate = True
 
-        utils.dict_annihilate(merged_dict)
+        if needs_annihilate:
+            utils.dict_annihilate(merged_dict)
         return merged_dict
 
     @property
@@ -508,7 +665,7 @@ class Item:
         :param uid: The new uid.
         """
         if self._uid != uid and self.COLLECTION_TYPE != Item.COLLECTION_TYPE:
-            name = self.name.lower()
+            name = self._name.lower()
             collection = self.api.get_items(self.COLLECTION_TYPE)
             with collection.lock:
                 if collection.get(name) is not None:
@@ -563,7 +720,7 @@ class Item:
         """
         if not isinstance(name, str):  # type: ignore
             raise TypeError("name must of be type str")
-        if not RE_OBJECT_NAME.match(name):
+        if name.translate(_OBJECT_NAME_CHARS):
             raise ValueError(f"Invalid characters in name: '{name}'")
         self._name = name
 
@@ -745,7 +902,7 @@ class Item:
             if mgmt_parameters == "":
                 self._mgmt_parameters = {}
                 return
-            mgmt_parameters = yaml.safe_load(mgmt_parameters)
+            mgmt_parameters = copy.deepcopy(_load_yaml(mgmt_parameters))
             if not isinstance(mgmt_parameters, dict):
                 raise TypeError(
                     "Input YAML in Puppet Parameter field must evaluate to a dictionary."
@@ -900,7 +1057,7 @@ class Item:
         if not parent:
             self._parent = ""
             return
-        if parent == self.name:
+        if parent == self._name:
             # check must be done in two places as setting parent could be called before/after setting name...
             raise CX("self parentage is weird")
         found = self.api.get_items(self.COLLECTION_TYPE).get(parent)
@@ -995,19 +1152,25 @@ class Item:
 
         :getter: This is a list of all descendants. May be empty if none exist.
         """
-        childs = self.tree_walk()
-        results = set(childs)
-        childs.append(self)  # type: ignore
-        for child in childs:
-            for item_type in Item.TYPE_DEPENDENCIES[child.COLLECTION_TYPE]:
+        # Breadth-first walk over children and dependent items. Every item is only visited once, even if it can be
+        # reached through several paths.
+        results: Set[Any] = set()
+        queue: Deque[Any] = deque([self])
+        while queue:
+            current = queue.popleft()
+            related: List[Any] = current.children
+            for item_type in Item.TYPE_DEPENDENCIES[current.COLLECTION_TYPE]:
                 dep_type_items = self.api.find_items(
-                    item_type[0], {item_type[1]: child.name}, return_list=True
+                    item_type[0], {item_type[1]: current._name}, return_list=True
                 )
                 if dep_type_items is None or not isinstance(dep_type_items, list):
                     raise ValueError("Expected list to be returned by find_items")
-                results.update(dep_type_items)
-                for dep_item in dep_type_items:
-                    results.update(dep_item.descendants)
+                related.extend(dep_type_items)
+            for related_item in related:
+                if related_item not in results:
+                    results.add(related_item)
+                    queue.append(related_item)
+        results.discard(self)
         return list(results)
 
     @LazyProperty
@@ -1054,7 +1217,7 @@ class Item:
         """
         # used by find() method in collection.py
         data = self.to_dict()
-        for (key, value) in list(kwargs.items()):
+        for key, value in kwargs.items():
             # Allow ~ to negate the compare
             if value is not None and value.startswith("~"):
                 res = not self.find_match_single_key(data, key, value[1:], no_errors)
@@ -1079,40 +1242,18 @@ class Item:
         """
         # special case for systems
         key_found_already = False
-        if "interfaces" in data:
-            if key in [
-                "cnames",
-                "connected_mode",
-                "if_gateway",
-                "ipv6_default_gateway",
-                "ipv6_mtu",
-                "ipv6_prefix",
-                "ipv6_secondaries",
-                "ipv6_static_routes",
-                "management",
-                "mtu",
-                "static",
-                "mac_address",
-                "ip_address",
-                "ipv6_address",
-                "netmask",
-                "virt_bridge",
-                "dhcp_tag",
-                "dns_name",
-                "static_routes",
-                "interface_type",
-                "interface_master",
-                "bonding_opts",
-                "bridge_opts",
-                "interface",
-            ]:
-                key_found_already = True
-                for (name, interface) in list(data["interfaces"].items()):
-                    if value == name:
+        if "interfaces" in data and key in _INTERFACE_SEARCH_KEYS:
+            key_found_already = True
+            find_compare = self.__find_compare
+            for name, interface in data["interfaces"].items():
+                if value == name:
+                    return True
+                if value is not None and key in interface:
+                    # The search value is the pattern and the interface value the object, like for all other keys.
+                    # Thus wildcards in the search apply and list-valued fields such as "cnames" are checked for
+                    # membership.
+                    if find_compare(value, interface[key]):
                         return True
-                    if value is not None and key in interface:
-                        if self.__find_compare(interface[key], value):
-                            return True
 
         if key not in data:
             if not key_found_already:
@@ -1187,14 +1328,20 @@ class Item:
             return
         old_has_initialized = self._has_initialized
         self._has_initialized = False
-        result = copy.deepcopy(dictionary)
+        # Only the keys are needed to report what could not be set, thus a shallow copy is enough.
+        result = dictionary.copy()
         for key in dictionary:
             lowered_key = key.lower()
             # The following also works for child classes because self is a child class at this point and not only an
-            # Item.
-            if hasattr(self, "_" + lowered_key):
+            # Item. All raw values are instance attributes, thus a lookup in the instance dictionary is enough and
+            # methods with a leading underscore are not mistaken for one.
+            if "_" + lowered_key in self.__dict__:
+                value = dictionary[key]
+                if value == enums.VALUE_INHERITED:
+                    # Share the one sentinel object instead of keeping a copy per deserialized attribute.
+                    value = enums.VALUE_INHERITED
                 try:
-                    setattr(self, lowered_key, dictionary[key])
+                    setattr(self, lowered_key, value)
                 except AttributeError as error:
                     raise AttributeError(
                         f'Attribute "{lowered_key}" could not be set!'
@@ -1207,24 +1354,32 @@ class Item:
                 f"The following keys supplied could not be set: {result.keys()}"
             )
 
-    def to_dict(self, resolved: bool = False) -> Dict[Any, Any]:
+    def to_dict(
+        self, resolved: bool = False, for_serialization: bool = False
+    ) -> Dict[Any, Any]:
         """
-        This converts everything in this object to a dictionary.
+        This converts everything in this object to a dictionary. Lists and dictionaries are copied shallowly, callers
+        that modify nested values have to copy the result themselves (e.g. ``make_clone()``).
 
         :param resolved: If this is True, Cobbler will resolve the values to its final form, rather than give you the
                      objects raw value.
+        :param for_serialization: If this is True, the computed values and the aliases for API compatibility are left
+                                  out. The result is not cached.
         :return: A dictionary with all values present in this object.
         """
         if not self.inmemory:
             self.deserialize()
-        cached_result = self.cache.get_dict_cache(resolved)
-        if cached_result is not None:
-            return cached_result
+        if not for_serialization:
+            cached_result = self.cache.get_dict_cache(resolved)
+            if cached_result is not None:
+                return cached_result
 
         value: Dict[str, Any] = {}
         for key, key_value in self.__dict__.items():
-            if self.__is_dict_key(key):
-                new_key = key[1:].lower()
+            new_key = self.__dict_key(key)
+            if new_key is not None:
+                if for_serialization and new_key in self._NOT_SERIALIZED_KEYS:
+                    continue
                 if isinstance(key_value, enum.Enum):
                     if resolved:
                         value[new_key] = getattr(self, new_key).value
@@ -1240,20 +1395,18 @@ class Item:
                         ].to_dict(resolved)
                     value[new_key] = serialized_interfaces
                 elif isinstance(key_value, list):
-                    value[new_key] = copy.deepcopy(key_value)  # type: ignore
+                    value[new_key] = key_value.copy()  # type: ignore
                 elif isinstance(key_value, dict):
                     if resolved:
                         value[new_key] = getattr(self, new_key)
                     else:
-                        value[new_key] = copy.deepcopy(key_value)  # type: ignore
-                elif (
-                    isinstance(key_value, str)
-                    and key_value == enums.VALUE_INHERITED
-                    and resolved
-                ):
-                    value[new_key] = getattr(self, key[1:])
+                        value[new_key] = key_value.copy()  # type: ignore
+                elif resolved and key_value == enums.VALUE_INHERITED:
+                    value[new_key] = getattr(self, new_key)
                 else:
                     value[new_key] = key_value
+        if for_serialization:
+            return value
         if "autoinstall" in value:
             value.update({"kickstart": value["autoinstall"]})  # type: ignore
         if "autoinstall_meta" in value:
@@ -1268,16 +1421,7 @@ class Item:
 
         :return: The dictionary with the information for serialization.
         """
-        keys_to_drop = [
-            "kickstart",
-            "ks_meta",
-            "remote_grub_kernel",
-            "remote_grub_initrd",
-        ]
-        result = self.to_dict()
-        for key in keys_to_drop:
-            result.pop(key, "")
-        return result
+        return self.to_dict(for_serialization=True)
 
     def deserialize(self) -> None:
         """
@@ -1320,7 +1464,7 @@ class Item:
             results.append(parent)
             parent = parent.logical_parent
             # FIXME: Now get the object and check its existence
-        results.append(self.api.settings())
+        results.append(self._cache.settings)
         self.logger.debug(
             "grab_tree found %s children (including settings) of this object",
             len(results),
@@ -1346,7 +1490,7 @@ class Item:
                     Can be Item, Settings or SIGNATURE_CACHE.
         :param name: The name of Item attribute or None.
         """
-        if not self.api.settings().cache_enabled:
+        if not self._cache.settings.cache_enabled:
             return
 
         if name is not None and self._inmemory:
@@ -1354,7 +1498,7 @@ class Item:
             if (
                 isinstance(attr, (InheritableProperty, InheritableDictProperty))
                 and self.COLLECTION_TYPE != Item.COLLECTION_TYPE
-                and self.api.get_items(self.COLLECTION_TYPE).get(self.name) is not None
+                and self.api.get_items(self.COLLECTION_TYPE).get(self._name) is not None
             ):
                 # Invalidating "resolved" caches
                 for dep_item in self.descendants:
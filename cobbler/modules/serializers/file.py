@@ -14,7 +14,6 @@ import logging
 import os
 from typing import TYPE_CHECKING, Any, Dict, List
 
-import cobbler.api as capi
 from cobbler import settings
 from cobbler.cexceptions import CX
 from cobbler.modules.serializers import StorageBase
@@ -72,7 +71,7 @@ class FileSerializer(StorageBase):
         filename = os.path.join(self.libpath, collection_types, item.name + ".json")
         _find_double_json_files(filename)
 
-        if capi.CobblerAPI().settings().serializer_pretty_json:
+        if self.api.settings().serializer_pretty_json:
             sort_keys = True
             indent = 4
         else:
@@ -71,6 +71,48 @@ def test_find(
     assert result[0].name == name
 
 
+def test_find_name_case_insensitive(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[str], distro.Distro],
+    distro_collection: distros.Distros,
+):
+    # Arrange
+    name = "Test_Find_Case"
+    item1 = create_distro(name)
+    distro_collection.add(item1)
+
+    # Act
+    result = distro_collection.find(
+        return_list=True, name=name.lower(), arch=item1.arch.value
+    )
+
+    # Assert
+    assert isinstance(result, list)
+    assert len(result) == 1
+    assert result[0].name == name
+
+
+def test_find_negated_name(
+    cobbler_api: CobblerAPI,
+    create_distro: Callable[[str], distro.Distro],
+    distro_collection: distros.Distros,
+):
+    # Arrange
+    item1 = create_distro("test_find_negated1")
+    item2 = create_distro("test_find_negated2")
+    distro_collection.add(item1)
+    distro_collection.add(item2)
+
+    # Act
+    result = distro_collection.find(
+        return_list=True, name="~" + item1.name, arch=item2.arch.value
+    )
+
+    # Assert
+    assert isinstance(result, list)
+    assert [item.name for item in result] == [item2.name]
+
+
 def test_to_list(
     cobbler_api: CobblerAPI,
     create_distro: Callable[[str], distro.Distro],
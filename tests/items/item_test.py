@@ -277,6 +277,22 @@ def test_name(cobbler_api: CobblerAPI):
     assert titem.name == "testname"
 
 
+@pytest.mark.parametrize(
+    "input_name",
+    ["test name", "test/name", "testname\n", "tëstname"],
+)
+def test_name_invalid(cobbler_api: CobblerAPI, input_name: str):
+    """
+    Assert that an abstract Cobbler Item rejects names with characters outside of the allowed set.
+    """
+    # Arrange
+    titem = Item(cobbler_api)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        titem.name = input_name
+
+
 def test_comment(cobbler_api: CobblerAPI):
     """
     Assert that an abstract Cobbler Item can use the Getter and Setter of the comment property correctly.
@@ -463,6 +479,23 @@ def test_mgmt_parameters(
         assert titem.mgmt_parameters == expected_result
 
 
+def test_mgmt_parameters_not_shared(cobbler_api: CobblerAPI):
+    """
+    Assert that two Items which are given the same YAML string don't share the parsed mgmt_parameters.
+    """
+    # Arrange
+    titem1 = Item(cobbler_api)
+    titem2 = Item(cobbler_api)
+    titem1.mgmt_parameters = "a: [1, 2]"
+    titem2.mgmt_parameters = "a: [1, 2]"
+
+    # Act
+    titem1._mgmt_parameters["a"].append(3)  # type: ignore
+
+    # Assert
+    assert titem2._mgmt_parameters == {"a": [1, 2]}  # type: ignore
+
+
 def test_template_files(cobbler_api: CobblerAPI):
     """
     Assert that an abstract Cobbler Item can use the Getter and Setter of the template_files property correctly.
@@ -560,6 +593,36 @@ def test_find_match(
         ({"uid": "test", "name": "test-name"}, "uid", "test", True),
         ({"depth": "1"}, "name", "test", False),
         ({"uid": "test", "name": "test-name"}, "menu", "testmenu0", False),
+        ({"name": "Test-Name"}, "name", "test-*", True),
+        ({"name": "test-name"}, "name", "test-[0-9]*", False),
+        ({"kernel_options": {"a": "1", "b": "2"}}, "kernel_options", "a=1", True),
+        ({"kernel_options": {"a": "1"}}, "kernel_options", "a=1 b=2", False),
+        ({"kernel_options": {"a": "1"}}, "kernel_options", "a=2", False),
+        (
+            {"interfaces": {"eth0": {"mac_address": "aa:bb:cc:dd:ee:ff"}}},
+            "mac_address",
+            "aa:bb:cc:dd:ee:*",
+            True,
+        ),
+        (
+            {"interfaces": {"eth0": {"mac_address": "aa:bb:cc:dd:ee:ff"}}},
+            "mac_address",
+            "AA:BB:CC:DD:EE:FF",
+            True,
+        ),
+        (
+            {"interfaces": {"eth0": {"cnames": ["a.example.org", "b.example.org"]}}},
+            "cnames",
+            "a.example.org",
+            True,
+        ),
+        ({"interfaces": {"eth0": {"static": True}}}, "static", "true", True),
+        (
+            {"interfaces": {"eth0": {"mac_address": "aa:bb:cc:dd:ee:ff"}}},
+            "mac_address",
+            "aa:bb:cc:dd:ee:00",
+            False,
+        ),
     ],
 )
 def test_find_match_single_key(
@@ -753,6 +816,38 @@ def test_serialize(cobbler_api: CobblerAPI):
     assert "remote_grub_kernel" not in result
 
 
+@pytest.mark.parametrize(
+    "item_type,dropped_keys",
+    [
+        (Distro, ["ks_meta", "remote_grub_kernel", "remote_grub_initrd"]),
+        (Profile, ["kickstart", "ks_meta"]),
+    ],
+)
+def test_serialize_keeps_dict_cache(
+    cobbler_api: CobblerAPI,
+    monkeypatch: pytest.MonkeyPatch,
+    item_type: Any,
+    dropped_keys: List[str],
+):
+    """
+    Assert that serializing an Item with an enabled cache doesn't remove keys from the cached dictionary.
+    """
+    # Arrange
+    monkeypatch.setattr(cobbler_api.settings(), "cache_enabled", True)
+    titem = item_type(cobbler_api)
+    titem.to_dict()
+
+    # Act
+    result = titem.serialize()
+    cached_result = titem.to_dict()
+
+    # Assert
+    assert cached_result is titem.cache.get_dict_cache(False)
+    for key in dropped_keys:
+        assert key not in result
+        assert key in cached_result
+
+
 def test_grab_tree(cobbler_api: CobblerAPI):
     """
     Assert that grabbing the item tree is containing the settings.